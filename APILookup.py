@@ -1,15 +1,24 @@
 """API Lookups"""
+import json
 import logging
-import requests
+import threading
+import time
+from HelperFunctions import HelperFunctions
 
 
 class APILookup:
     ############################################################
     # constructor
     ############################################################
-    def __init__(self, postcode_api_url):
+    def __init__(self, postcode_api_url, cache_ttl=3600, cache_size=1024):
 
         self.postcode_api_url = postcode_api_url
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._postcode_cache = {}
+        self._cache_lock = threading.Lock()
+        self.helper_f = HelperFunctions()
+        self.session = self.helper_f.create_http_session()
         self.LOGGER = logging.getLogger(__name__)
 
     ############################################################
@@ -19,6 +28,50 @@ class APILookup:
 
         return repr(self.postcode_api_url)
 
+    ############################################################
+    # Cache key - "SW1A 1AA" and "sw1a1aa" are the same postcode
+    ############################################################
+    def _cache_key(self, post_code):
+
+        return str(post_code).strip().upper().replace(" ", "")
+
+    ############################################################
+    # Get cached postcode lookup if not expired
+    ############################################################
+    def _get_cached(self, cache_key):
+
+        with self._cache_lock:
+            hit = self._postcode_cache.get(cache_key)
+
+            if hit is None:
+                return None
+
+            if time.monotonic() - hit[0] >= self.cache_ttl:
+                del self._postcode_cache[cache_key]
+                return None
+
+        # cache holds the response text - parse so each caller gets its own copy
+        return json.loads(hit[1])
+
+    ############################################################
+    # Add lookup to cache, dropping expired then oldest entries
+    # when full
+    ############################################################
+    def _set_cached(self, cache_key, resp_text):
+
+        with self._cache_lock:
+            now = time.monotonic()
+
+            if len(self._postcode_cache) >= self.cache_size:
+                expired = [k for k, hit in self._postcode_cache.items() if now - hit[0] >= self.cache_ttl]
+                for k in expired:
+                    del self._postcode_cache[k]
+
+            while len(self._postcode_cache) >= self.cache_size:
+                del self._postcode_cache[next(iter(self._postcode_cache))]
+
+            self._postcode_cache[cache_key] = (now, resp_text)
+
     ############################################################
     # Lookup postcode on API to get lat/long
     ############################################################
@@ -33,10 +86,21 @@ class APILookup:
 
         try:
             data = ''
-            lkp_url = self.postcode_api_url + str(post_code)
+            cache_key = self._cache_key(post_code)
+            cached = self._get_cached(cache_key)
+
+            if cached is not None:
+                data = cached
+            else:
+                lkp_url = self.postcode_api_url + str(post_code)
+
+                resp = self.session.get(url=lkp_url)
+                data = resp.json()
+
+                # only cache successful lookups - not 404/400 error bodies
+                if resp.status_code == 200:
+                    self._set_cached(cache_key, resp.text)
 
-            resp = requests.get(url=lkp_url)
-            data = resp.json()
             self.LOGGER.debug(data)
 
         except Exception as exrec:
@@ -6,21 +6,41 @@ import ssl
 import haversine
 from haversine import haversine
 import math
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from HelperFunctions import HelperFunctions
 
 
 class DistanceCalc:
 
+    # Distance Matrix API limit on destinations per request
+    MAX_MATRIX_DESTINATIONS = 25
+
     ############################################################
     # constructor
     ############################################################
     def __init__(self, api_key):
 
         self.api_key = api_key
+        self._gmaps = None
+        self._gmaps_lock = threading.Lock()
         self.helper_f = HelperFunctions()
         self.LOGGER = logging.getLogger(__name__)
 
+    ############################################################
+    # googlemaps client - built on first travel time lookup so
+    # haversine-only use does not need a valid api key
+    ############################################################
+    @property
+    def gmaps(self):
+
+        with self._gmaps_lock:
+            if self._gmaps is None:
+                self._gmaps = googlemaps.Client(key=self.api_key)
+
+            return self._gmaps
+
     ############################################################
     # str
     ############################################################
@@ -45,12 +65,11 @@ class DistanceCalc:
 
         try:
 
-            gmaps = googlemaps.Client(key=self.api_key)
-            directions_result = gmaps.directions(start_point,  # ("52.141366,-0.479573",
-                                                 end_point,  # "52.141366,-0.489573",
-                                                 mode="driving",
-                                                 avoid="ferries",
-                                                 departure_time=dept_time)
+            directions_result = self.gmaps.directions(start_point,  # ("52.141366,-0.479573",
+                                                      end_point,  # "52.141366,-0.489573",
+                                                      mode="driving",
+                                                      avoid="ferries",
+                                                      departure_time=dept_time)
             directions_dic = defaultdict(list)
 
             self.LOGGER.debug(directions_result)
@@ -85,6 +104,27 @@ class DistanceCalc:
 
         return rv_value
 
+    ############################################################
+    # Run independent lookups on an executor
+    ############################################################
+    def _run_concurrent(self, executor, func, *calls):
+        """Submit each call of func and return the results in order
+
+        Keyword arguments:
+        executor -- concurrent.futures.Executor, None for a local thread pool.
+                    Blocks on the results, so must not be the pool the caller
+                    itself is running on or nested calls can deadlock
+        func -- function to call
+        calls -- argument tuples, one per call
+        """
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=len(calls)) as local_executor:
+                futures = [local_executor.submit(func, *args) for args in calls]
+        else:
+            futures = [executor.submit(func, *args) for args in calls]
+
+        return [fut.result() for fut in futures]
+
     ############################################################
     # Get a list of travel time for the nearest stations
     # at 2 different times
@@ -114,3 +154,99 @@ class DistanceCalc:
             travel_times.append(lst_res_thur)
 
         return travel_times
+
+    ############################################################
+    # Lookup travel times from one start point to many end
+    # points in a single distance matrix request
+    ############################################################
+    def get_travel_time_matrix(self, start_point, end_points, dept_time):
+        """Do API distance matrix lookup for travel time to several end points
+
+        Returns one entry per end point, None where no route was found.
+
+        Keyword arguments:
+        start_point -- start point (lat,lon)
+        end_points -- list of end points [(lat,lon), ...]
+        dept_time -- departure time
+        """
+        try:
+
+            lst_directions = []
+
+            for i in range(0, len(end_points), self.MAX_MATRIX_DESTINATIONS):
+                chunk_points = end_points[i:i + self.MAX_MATRIX_DESTINATIONS]
+
+                matrix_result = self.gmaps.distance_matrix(start_point,
+                                                           chunk_points,
+                                                           mode="driving",
+                                                           avoid="ferries",
+                                                           departure_time=dept_time)
+                self.LOGGER.debug(matrix_result)
+
+                for end_point, element in zip(chunk_points, matrix_result['rows'][0]['elements']):
+
+                    if element['status'] != 'OK':
+                        self.LOGGER.warning("No travel time from %s to %s : %s",
+                                            str(start_point), str(end_point), element['status'])
+                        lst_directions.append(None)
+                        continue
+
+                    directions_dic = defaultdict(list)
+
+                    directions_dic["distance"].append(element['distance']['text'])
+                    directions_dic["duration"].append(element['duration']['text'])
+                    directions_dic["time"].append(dept_time)
+
+                    lst_directions.append(directions_dic)
+
+            return lst_directions
+        except Exception:
+            self.LOGGER.error("Error in get_travel_time_matrix - please check", exc_info=True)
+            raise Exception("Error in get_travel_time_matrix")
+
+    ############################################################
+    # Get travel times at 2 different times for a list of
+    # nearest stations - one API request per departure time
+    ############################################################
+    def get_travel_times_batch(self, start_point, end_points, executor=None):
+        """Get Mon 8am and Thurs 11pm travel times to several end points
+
+        Keyword arguments:
+        start_point -- start point (lat,lon)
+        end_points -- list of end points [(lat,lon), ...]
+        executor -- optional concurrent.futures.Executor, see _run_concurrent
+        """
+        travel_times = [[] for _ in end_points]
+
+        if "nan" in str(start_point):
+            self.LOGGER.debug("start point is null %s", str(start_point))
+            return travel_times
+
+        valid_idx = [i for i, point in enumerate(end_points) if "nan" not in str(point)]
+        if not valid_idx:
+            return travel_times
+
+        valid_points = [end_points[i] for i in valid_idx]
+
+        # Mon 8am
+        current_time = datetime.datetime.now()
+        new_period1 = current_time.replace(hour=8, minute=00, second=00, microsecond=0)
+        next_monday = self.helper_f.next_weekday(new_period1, 0).timestamp()
+
+        # Thurs 11pm
+        new_period2 = current_time.replace(hour=23, minute=00, second=00, microsecond=0)
+        next_thursday = self.helper_f.next_weekday(new_period2, 3).timestamp()
+
+        lst_res_mon, lst_res_thur = self._run_concurrent(executor, self.get_travel_time_matrix,
+                                                         (start_point, valid_points, next_monday),
+                                                         (start_point, valid_points, next_thursday))
+
+        for i, res_mon, res_thur in zip(valid_idx, lst_res_mon, lst_res_thur):
+            # leave [] where either lookup found no route
+            if res_mon is None or res_thur is None:
+                continue
+
+            travel_times[i].append(res_mon)
+            travel_times[i].append(res_thur)
+
+        return travel_times
@@ -10,7 +10,7 @@ class GetNearest:
     ############################################################
     # constructor
     ############################################################
-    def __init__(self, top_n, bln_travel_times, api_key):
+    def __init__(self, top_n, bln_travel_times, api_key, executor=None):
         self.name = "Get Nearest"
         self.top_n = top_n
         self.LOGGER = logging.getLogger(__name__)
@@ -18,6 +18,7 @@ class GetNearest:
         self.dist_calc = DistanceCalc(api_key=api_key)
         self.bln_travel_times = bln_travel_times
         self.api_key = api_key
+        self.executor = executor
 
     ############################################################
     # str
@@ -52,11 +53,14 @@ class GetNearest:
         df_fs_dist = firestations_df
         df_fs_dist['distance'] = distance_list
 
-        """sort by distance ascending"""
-        df_fs_dist.sort_values(by=['distance'], inplace=True)
+        """Get top n by distance ascending - no need to sort the whole frame"""
+        df_fs_dist_ret = df_fs_dist.nsmallest(int(self.top_n), 'distance')
 
-        """Get top n"""
-        df_fs_dist_ret = df_fs_dist[:int(self.top_n)]
+        """Get travel times for all top n in one request per departure time"""
+        if self.bln_travel_times:
+            points = list(zip(df_fs_dist_ret['lat'], df_fs_dist_ret['lon']))
+            lst_all_travel_times = self.dist_calc.get_travel_times_batch(base_point, points,
+                                                                         executor=self.executor)
 
         lst_json = []
         lc = 0
@@ -65,18 +69,14 @@ class GetNearest:
 
             lst_travel = []
 
-            a_json_str = df_fs_dist_ret.iloc[lc].to_json()
+            a_json_str = rw.to_json()
             a_a = re.sub(r"(?i)(?:\\u00[0-9a-f]{2})+", self.helper_f.untangle_utf8, a_json_str)
 
             lst_travel.append(a_a)
-            lat = rw['lat']
-            lon = rw['lon']
-            point = (lat, lon)
 
             """Get travel time if required"""
             if self.bln_travel_times:
-                lst_travel_times = self.dist_calc.get_travel_times(base_point, point)
-                lst_travel.append(lst_travel_times)
+                lst_travel.append(lst_all_travel_times[lc])
 
             lst_json.append(lst_travel)
             lc += 1
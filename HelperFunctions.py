@@ -5,6 +5,9 @@ import datetime
 import codecs
 import configparser
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class HelperFunctions:
@@ -44,6 +47,27 @@ class HelperFunctions:
                 config[name + "." + opt.lower()] = cp.get(sec, opt).strip()
         return config
 
+    ############################################################
+    # Create a pooled keep-alive http session
+    ############################################################
+    def create_http_session(self, pool_size=10, retries=5):
+        """Create a requests session with a connection pool and retries
+
+        Keyword arguments:
+        pool_size -- number of connections to keep alive per host
+        retries -- number of retries, with backoff, on throttling/server errors
+        """
+        # raise_on_status=False - return the last response once retries are exhausted
+        retry = Retry(total=retries, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     ############################################################
     # Get query string value from link
     ############################################################
@@ -54,18 +78,27 @@ class HelperFunctions:
         url -- href link
         query_string -- query string key to search for
         """
+        return self.get_qs_values(url, [query_string])[0]
+
+    ############################################################
+    # Get several query string values from link
+    ############################################################
+    def get_qs_values(self, url, query_strings):
+        """get query string values from passed url, parsing the url once
+
+        Keyword arguments:
+        url -- href link
+        query_strings -- list of query string keys to search for
+        """
         try:
 
             parsed = urlparse.urlparse(url)
-            qs_value = urlparse.parse_qs(parsed.query)[query_string]
+            qs_values = urlparse.parse_qs(parsed.query)
 
-            for k in qs_value:
-                return str(k)
+            return [str(qs_values[k][0]) if k in qs_values else "" for k in query_strings]
 
-        except KeyError:
-            return ""
         except Exception:
-            raise Exception("Error in get_qs_value - %s %s ", url, query_string)
+            raise Exception("Error in get_qs_values - %s %s ", url, query_strings)
 
     ############################################################
     # Get EPOCH days ahead
@@ -1,9 +1,7 @@
 """Page Scraper - scrape html from a passed url"""
 import logging
 import urllib
-import urllib.request
 import urllib.parse
-import requests
 from bs4 import BeautifulSoup
 from HelperFunctions import HelperFunctions
 import io
@@ -20,6 +18,7 @@ class PageScraper:
         self.site_url = url
         self.html_table = ""
         self.helper_f = HelperFunctions()
+        self.session = self.helper_f.create_http_session()
         self.table_output_rows = []
         self.LOGGER = logging.getLogger(__name__)
 
@@ -41,11 +40,8 @@ class PageScraper:
         form_values -- form values to post
         """
         try:
-            output_html = ""
             form_val = {form_value: '%', 'Submit': 'Select'}
             form_data = urllib.parse.urlencode(form_val)
-            header = {"Content-type": "application/x-www-form-urlencoded",
-                      "Accept": "text/plain", "Referer": self.site_url}
 
             header2 = {}
 
@@ -56,13 +52,12 @@ class PageScraper:
             header2['Content-type'] = "application/x-www-form-urlencoded"
 
             # body = form_data.encode(encoding='utf-8')
-            s = requests.Session()
             # providers = s.post(url, params=form_data, data=form_data, timeout=15, verify=True,headers=header)
 
             # Open a sesssion first
-            s.get(self.site_url)
+            self.session.get(self.site_url)
             # Post form data to get
-            r = s.post(self.site_url , data=form_data, headers=header2, verify=True)
+            r = self.session.post(self.site_url , data=form_data, headers=header2, verify=True)
             self.html = str(r.text)
 
             self.LOGGER.debug("Status: %s", str(r.status_code))
@@ -86,28 +81,11 @@ class PageScraper:
         form_values -- form values to post
         """
         try:
-            output_html = ""
-            form_val = {form_value: '%', 'Submit': 'Select'}
-            form_data = urllib.parse.urlencode(form_val)
-            header = {"Content-type": "application/x-www-form-urlencoded",
-                      "Accept": "text/plain", "Referer": self.site_url}
-
-            header2 = {}
+            r = self.session.get(self.site_url)
+            self.html = r.content.decode("utf8")
 
-            header2[
-                'User-Agent'] = "Mozilla/5.0 (Windows NT 6.1; WOW64) AppleWebKit/537.36 (KHTML, like Gecko)" \
-                                " Chrome/41.0.2272.101 Safari/537.36"
-            header2['Accept'] = "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"
-            header2['Content-type'] = "application/x-www-form-urlencoded"
-
-            fp = urllib.request.urlopen(self.site_url)
-            mybytes = fp.read()
-
-            mystr = mybytes.decode("utf8")
-            fp.close()
-            self.html = str(mystr)
-
-            self.LOGGER.debug("reason: %s", str("xx"))
+            self.LOGGER.debug("Status: %s", str(r.status_code))
+            self.LOGGER.debug("reason: %s", str(r.reason))
 
         except Exception:
             raise Exception("Error in Page_scraper - URL : %s  form value : %s ", self.site_url)
@@ -184,11 +162,8 @@ class PageScraper:
                         for link in column.findAll('a', href=True):
                             """print(link['href'])"""
                             fs_link = link['href']
-                            """Get latitude qs value"""
-                            lat = self.helper_f.get_qs_value(fs_link, 'lat')
-
-                            """Get longitude qs value"""
-                            lon = self.helper_f.get_qs_value(fs_link, 'lon')
+                            """Get latitude and longitude qs values"""
+                            lat, lon = self.helper_f.get_qs_values(fs_link, ['lat', 'lon'])
                             """TODO get_accuracy(row)"""
 
                         #Append first column header as not in data
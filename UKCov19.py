@@ -4,6 +4,66 @@ import csv
 from uk_covid19 import Cov19API
 from HelperFunctions import HelperFunctions
 
+# Request structures - static so built once at import
+ENGLAND_STRUCTURE = {
+    "date": "date",
+    "areaCode": "areaCode",
+    "areaName": "areaName",
+    "newCasesByPublishDate":
+        "newCasesByPublishDate",
+    "newCasesBySpecimenDate":
+        "newCasesBySpecimenDate",
+    "newDeaths28DaysByDeathDate":
+        "newDeaths28DaysByDeathDate",
+    "hospitalCases":
+        "hospitalCases",
+    "newAdmissions":
+        "newAdmissions"
+}
+
+UK_STRUCTURE = {
+    "areaCode": "areaCode",
+    "areaName": "areaName",
+    "areaType": "areaType",
+    "date": "date",
+    "newCasesByPublishDate":
+        "newCasesByPublishDate",
+    "newCasesBySpecimenDate":
+        "newCasesBySpecimenDate",
+    "newDeaths28DaysByDeathDate":
+        "newDeaths28DaysByDeathDate",
+    "hospitalCases":
+        "hospitalCases",
+    "newAdmissions":
+        "newAdmissions"
+}
+
+CASE_DEMO_STRUCTURE = {
+    "date": "date",
+    "areaCode": "areaCode",
+    "areaName": "areaName",
+    "areaType": "areaType",
+    "newCasesBySpecimenDateAgeDemographics": "newCasesBySpecimenDateAgeDemographics"
+}
+
+REGION_HOSP_STRUCTURE = {
+    "areaCode": "areaCode",
+    "areaName": "areaName",
+    "areaType": "areaType",
+    "date": "date",
+    "covidOccupiedMVBeds": "covidOccupiedMVBeds",
+    "hospitalCases": "hospitalCases",
+    "newAdmissions": "newAdmissions"
+}
+
+CASE_POSITIVITY_STRUCTURE = {
+    "date": "date",
+    "areaCode": "areaCode",
+    "areaName": "areaName",
+    "areaType": "areaType",
+    "uniqueCasePositivityBySpecimenDateRollingSum": "uniqueCasePositivityBySpecimenDateRollingSum"
+}
+
 class UKCov19:
     ############################################################
     # constructor
@@ -37,28 +97,10 @@ class UKCov19:
             location_filter = [f'areaType={area_type}',
                                f'areaName={area_name}']
 
-            # The metric(s) to request. NOTE: More than in
-            # the previous example, for variety.
-            req_structure = {
-                "date": "date",
-                "areaCode": "areaCode",
-                "areaName": "areaName",
-                "newCasesByPublishDate":
-                    "newCasesByPublishDate",
-                "newCasesBySpecimenDate":
-                    "newCasesBySpecimenDate",
-                "newDeaths28DaysByDeathDate":
-                    "newDeaths28DaysByDeathDate",
-                "hospitalCases":
-                    "hospitalCases",
-                "newAdmissions":
-                    "newAdmissions"
-            }
-
             # Request the data.
             # This gets all pages and we don't need to care how.
             # , latest_by="newCasesBySpecimenDateAgeDemographics"
-            api = Cov19API(filters=location_filter, structure=req_structure)
+            api = Cov19API(filters=location_filter, structure=ENGLAND_STRUCTURE)
             # Get the data.
             # NOTE3: If a 204 (Success - no data) occurs can we tell?
             data = api.get_dataframe()
@@ -79,29 +121,10 @@ class UKCov19:
             # The location for which we want data.
             location_filter = [f'areaType={area_type}']
 
-            # The metric(s) to request. NOTE: More than in
-            # the previous example, for variety.
-            req_structure = {
-                "areaCode": "areaCode",
-                "areaName": "areaName",
-                "areaType": "areaType",
-                "date": "date",
-                "newCasesByPublishDate":
-                    "newCasesByPublishDate",
-                "newCasesBySpecimenDate":
-                    "newCasesBySpecimenDate",
-                "newDeaths28DaysByDeathDate":
-                    "newDeaths28DaysByDeathDate",
-                "hospitalCases":
-                    "hospitalCases",
-                "newAdmissions":
-                    "newAdmissions"
-            }
-
             # Request the data.
             # This gets all pages and we don't need to care how.
             # , latest_by="newCasesBySpecimenDateAgeDemographics"
-            api = Cov19API(filters=location_filter, structure=req_structure)
+            api = Cov19API(filters=location_filter, structure=UK_STRUCTURE)
             # Get the data.
             # NOTE3: If a 204 (Success - no data) occurs can we tell?
             data = api.get_dataframe()
@@ -122,20 +145,10 @@ class UKCov19:
 
             # The location for which we want data.
             location_filter = [f'areaType={v_area_type}']
-            # The metric(s) to request. NOTE: More than in
-            # the previous example, for variety.
-            req_structure = {
-                "date": "date",
-                "areaCode": "areaCode",
-                "areaName": "areaName",
-                "areaType": "areaType",
-                "newCasesBySpecimenDateAgeDemographics": "newCasesBySpecimenDateAgeDemographics"
-            }
-
             # Request the data.
             # This gets all pages and we don't need to care how.
             # , latest_by="newCasesBySpecimenDateAgeDemographics"
-            api = Cov19API(filters=location_filter, structure=req_structure)
+            api = Cov19API(filters=location_filter, structure=CASE_DEMO_STRUCTURE)
             # Get the data.
             # NOTE3: If a 204 (Success - no data) occurs can we tell?
             data = api.get_dataframe()
@@ -157,22 +170,10 @@ class UKCov19:
 
             # The location for which we want data.
             location_filter = [f'areaType={area_type}']
-            # The metric(s) to request. NOTE: More than in
-            # the previous example, for variety.
-            req_structure = {
-                "areaCode": "areaCode",
-                "areaName": "areaName",
-                "areaType": "areaType",
-                "date": "date",
-                "covidOccupiedMVBeds": "covidOccupiedMVBeds",
-                "hospitalCases": "hospitalCases",
-                "newAdmissions": "newAdmissions"
-            }
-
             # Request the data.
             # This gets all pages and we don't need to care how.
             # , latest_by="newCasesBySpecimenDateAgeDemographics"
-            api = Cov19API(filters=location_filter, structure=req_structure)
+            api = Cov19API(filters=location_filter, structure=REGION_HOSP_STRUCTURE)
             # Get the data.
             # NOTE3: If a 204 (Success - no data) occurs can we tell?
             data = api.get_dataframe()
@@ -194,20 +195,10 @@ class UKCov19:
 
             # The location for which we want data.
             location_filter = [f'areaType={v_area_type}']
-            # The metric(s) to request. NOTE: More than in
-            # the previous example, for variety.
-            req_structure = {
-                "date": "date",
-                "areaCode": "areaCode",
-                "areaName": "areaName",
-                "areaType": "areaType",
-                "uniqueCasePositivityBySpecimenDateRollingSum": "uniqueCasePositivityBySpecimenDateRollingSum"
-            }
-
             # Request the data.
             # This gets all pages and we don't need to care how.
             # , latest_by="newCasesBySpecimenDateAgeDemographics"
-            api = Cov19API(filters=location_filter, structure=req_structure)
+            api = Cov19API(filters=location_filter, structure=CASE_POSITIVITY_STRUCTURE)
             # Get the data.
             # NOTE3: If a 204 (Success - no data) occurs can we tell?
             data = api.get_dataframe()
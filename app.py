@@ -2,14 +2,11 @@ import os
 import sys
 import logging.config
 import simplejson as json
-import pandas
 from PageScraper import PageScraper
 from UKCov19 import UKCov19
-from APILookup import APILookup
-from DistanceCalc import DistanceCalc
 from HelperFunctions import HelperFunctions
-from GetNearest import GetNearest
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 """Read Firestations web page data """
 """Project Classes"""
 """ Other Imports"""
@@ -54,16 +51,13 @@ def main():
         SCOT_VACCINE_DATA_URL = configImport["covid_data.url_scot_vaccine_supply"]
         TEMP_FILE = configImport["covid_data.temp_file"]
         TABLE_CLASS = configImport["covid_data.key_marker"] ##"ds_accordion-item__body"
-        uodf_regionaldemographiccases = pandas.DataFrame
-        uodf_regionalhospdata = pandas.DataFrame
-        uodf_ukdata = pandas.DataFrame
-        ukdf_engdata = pandas.DataFrame
-        ukdf_engcasedemodata = pandas.DataFrame
+        API_MAX_WORKERS = int(configImport.get("covid_data.api_max_workers", "2"))
         """firestation_nearest_json_with_travel = configImport["firestation.json_file_with_travel"]"""
 
         LOGGER.debug("scot_vaccine_data_url  : %s ", SCOT_VACCINE_DATA_URL)
         # LOGGER.debug("Postcode api URL : %s ", POSTCODE_API_URL)
         LOGGER.debug("TEMP_FILE : %s ", TEMP_FILE)
+        LOGGER.debug("API_MAX_WORKERS : %s ", str(API_MAX_WORKERS))
         # LOGGER.debug("csv_file : %s ", CSV_FILE)
         # LOGGER.debug("number_closest : %s ", str(NUMBER_CLOSEST))
 
@@ -79,19 +73,32 @@ def main():
         ##fs_pagescraper.save_tab_as_list()
 
         ukapi = UKCov19()
-        uodf_regionaldemographiccases = ukapi.get_case_demo_data('region')
-        ukdf_engcasedemodata = ukapi.get_case_demo_data('nation')
-        uodf_regionalhospdata = ukapi.get_region_hosp_data()
-        uodf_ukdata = ukapi.get_data_uk()
-        ukdf_engdata = ukapi.get_data_england()
-        ukdf_regionalpositivitydata = ukapi.get_case_positivity_data('region')
 
-        uodf_regionaldemographiccases.to_csv('uodf_regionaldemographiccases.csv')
-        uodf_regionalhospdata.to_csv('uodf_regionalhospdata.csv')
-        ukdf_engcasedemodata.to_csv('ukdf_engcasedemodata.csv')
-        uodf_ukdata.to_csv('uodf_ukdata.csv')
-        ukdf_engdata.to_csv('ukdf_engdata.csv')
-        ukdf_regionalpositivitydata.to_csv('ukdf_regionalpositivitydata.csv')
+        # API requests are independent - run a few at once, the API is rate limited
+        with ThreadPoolExecutor(max_workers=API_MAX_WORKERS) as executor:
+            fut_datasets = {
+                'uodf_regionaldemographiccases.csv': executor.submit(ukapi.get_case_demo_data, 'region'),
+                'uodf_regionalhospdata.csv': executor.submit(ukapi.get_region_hosp_data),
+                'ukdf_engcasedemodata.csv': executor.submit(ukapi.get_case_demo_data, 'nation'),
+                'uodf_ukdata.csv': executor.submit(ukapi.get_data_uk),
+                'ukdf_engdata.csv': executor.submit(ukapi.get_data_england),
+                'ukdf_regionalpositivitydata.csv': executor.submit(ukapi.get_case_positivity_data, 'region')
+            }
+
+        # UKCov19 returns None if a request failed (e.g. throttled)
+        failed_datasets = []
+
+        for csv_file, fut_data in fut_datasets.items():
+            df_data = fut_data.result()
+
+            if df_data is None:
+                LOGGER.error("No data returned for : %s ", csv_file)
+                failed_datasets.append(csv_file)
+            else:
+                df_data.to_csv(csv_file)
+
+        if failed_datasets:
+            raise DataIngestError("Covid API data not returned for : " + ", ".join(failed_datasets))
 
 
         LOGGER.info('Completed run.')
@@ -121,33 +128,45 @@ def process_lkp_list(df_lkp, firestations_df, top_n, json_file, b_travel):
     lkp_list -- base point (lat_value, lon_value)
     firestations_df -- data frame of firestation data
     """
+    # Deferred import - googlemaps/haversine are only needed on this path
+    from GetNearest import GetNearest
+
     r_list = defaultdict(list)
     lkp_list = []
 
-    for index, row in df_lkp.iterrows():
+    # One pool shared by all travel time lookups, rather than one per lookup.
+    # create_nearest_list runs on this thread, not on the pool, so it can wait on it.
+    with ThreadPoolExecutor(max_workers=2) as travel_executor:
+
+        uo_get_nearest = GetNearest(top_n=top_n, bln_travel_times=b_travel,
+                                    api_key=configImport["covid_data.api_key"],
+                                    executor=travel_executor)
+
+        for index, row in df_lkp.iterrows():
 
-        nearest_list = []
+            nearest_list = []
 
-        lat_value = row['latitude']
-        lon_value = row['longitude']
+            lat_value = row['latitude']
+            lon_value = row['longitude']
 
-        LOGGER.debug("process_lkp_list :lat_value: %s", str(lat_value))
-        LOGGER.debug("process_lkp_list :lon_value: %s", str(lon_value))
+            LOGGER.debug("process_lkp_list :lat_value: %s", str(lat_value))
+            LOGGER.debug("process_lkp_list :lon_value: %s", str(lon_value))
 
-        lkp_list = df_lkp.values[index].tolist()
+            lkp_list = df_lkp.values[index].tolist()
 
-        base_point = (lat_value, lon_value)  # (lat, lon)
+            base_point = (lat_value, lon_value)  # (lat, lon)
 
-        """Return sorted list of nearest by distance"""
-        df_fs_dist_list = UO_GET_NEAREST.create_nearest_list(base_point,
-                                              firestations_df=firestations_df)
+            """Return sorted list of nearest by distance"""
+            df_fs_dist_list = uo_get_nearest.create_nearest_list(base_point,
+                                                                 firestations_df=firestations_df)
 
-        lkp_list.append(df_fs_dist_list)
+            lkp_list.append(df_fs_dist_list)
 
-        r_list["lkpaddress"].append(lkp_list)
+            r_list["lkpaddress"].append(lkp_list)
 
     """save as json"""
-    json.dump(r_list, open(json_file, "w"))
+    with open(json_file, "w", encoding="utf-8") as json_out:
+        json.dump(r_list, json_out)
 
 ############################################################
 # Run